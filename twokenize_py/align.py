@@ -31,16 +31,19 @@ class Aligner(object):
             onseta and offset in characters of ``tokens[i]`` relative to the
             beginning of ``text`` (0-indexed).
         """
+        # Tokens occur in ``text`` in order, so a single left-to-right sweep
+        # suffices. Searching from an offset rather than slicing avoids
+        # copying the remainder of ``text`` for every token.
         spans = []
         bi = 0
         for token in tokens:
-            try:
-                token_len = len(token)
-                token_bi = bi + text[bi:].index(token)
-                token_ei = token_bi + token_len - 1
-                spans.append([token_bi, token_ei])
-                bi = token_ei + 1
-            except ValueError:
-                raise AlignmentFailed(token)
+            if text.startswith(token, bi):
+                token_bi = bi
+            else:
+                token_bi = text.find(token, bi)
+                if token_bi < 0:
+                    raise AlignmentFailed(token)
+            bi = token_bi + len(token)
+            spans.append([token_bi, bi - 1])
 
         return spans
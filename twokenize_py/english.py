@@ -24,6 +24,17 @@ References
 """
 from __future__ import unicode_literals
 
+try:
+    from functools import lru_cache
+except ImportError:
+    # Python 2.
+    lru_cache = None
+from collections import deque, OrderedDict
+import io
+from itertools import islice
+import multiprocessing
+import re as std_re
+
 import regex as re
 
 
@@ -42,6 +53,20 @@ def regex_or(*items):
     return r
 
 
+def regex_or_pairs(*pairs):
+    """Like ``regex_or``, but for two-character literals.
+
+    Pairs sharing a first character are collapsed into a single character
+    class (e.g., "ac", "ad", "ae" becomes "a[cde]") so that the engine
+    branches on the first character rather than trying each pair in turn.
+    """
+    seconds = OrderedDict()
+    for pair in pairs:
+        seconds.setdefault(pair[0], []).append(pair[1])
+    return regex_or(*['%s[%s]' % (first, ''.join(rest))
+                      for first, rest in seconds.items()])
+
+
 def pos_lookahead(r):
     return '(?=' + r + ')'
 
@@ -76,34 +101,38 @@ COMMON_TLDS = regex_or('com', r'co\.uk', 'org', 'edu', 'gov', 'net', 'mil',
                        'aero', 'asia', 'biz', 'cat', 'coop', 'info', 'int',
                        'jobs', 'mobi', 'museum', 'name', 'pro', 'tel',
                        'travel', 'xxx', 'ca')
-COMMON_CC_TLDS = regex_or('ac', 'ad', 'ae', 'af', 'ag', 'ai', 'al', 'am', 'an', 'ao',
-                          'aq', 'ar', 'as', 'at', 'au', 'aw', 'ax', 'az', 'ba', 'bb',
-                          'bd', 'be', 'bf', 'bg', 'bh', 'bi', 'bj', 'bm', 'bn', 'bo',
-                          'br', 'bs', 'bt', 'bv', 'bw', 'by', 'bz', 'ca', 'cc', 'cd',
-                          'cf', 'cg', 'ch', 'ci', 'ck', 'cl', 'cm', 'cn', 'co', 'cr',
-                          'cs', 'cu', 'cv', 'cx', 'cy', 'cz', 'dd', 'de', 'dj', 'dk',
-                          'dm', 'do', 'dz', 'ec', 'ee', 'eg', 'eh', 'er', 'es', 'et',
-                          'eu', 'fi', 'fj', 'fk', 'fm', 'fo', 'fr', 'ga', 'gb', 'gd',
-                          'ge', 'gf', 'gg', 'gh', 'gi', 'gl', 'gm', 'gn', 'gp', 'gq',
-                          'gr', 'gs', 'gt', 'gu', 'gw', 'gy', 'hk', 'hm', 'hn', 'hr',
-                          'ht', 'hu', 'id', 'ie', 'il', 'im', 'in', 'io', 'iq', 'ir',
-                          'is', 'it', 'je', 'jm', 'jo', 'jp', 'ke', 'kg', 'kh', 'ki',
-                          'km', 'kn', 'kp', 'kr', 'kw', 'ky', 'kz', 'la', 'lb', 'lc',
-                          'li', 'lk', 'lr', 'ls', 'lt', 'lu', 'lv', 'ly', 'ma', 'mc',
-                          'md', 'me', 'mg', 'mh', 'mk', 'ml', 'mm', 'mn', 'mo', 'mp',
-                          'mq', 'mr', 'ms', 'mt', 'mu', 'mv', 'mw', 'mx', 'my', 'mz',
-                          'na', 'nc', 'ne', 'nf', 'ng', 'ni', 'nl', 'no', 'np', 'nr',
-                          'nu', 'nz', 'om', 'pa', 'pe', 'pf', 'pg', 'ph', 'pk', 'pl',
-                          'pm', 'pn', 'pr', 'ps', 'pt', 'pw', 'py', 'qa', 're', 'ro',
-                          'rs', 'ru', 'rw', 'sa', 'sb', 'sc', 'sd', 'se', 'sg', 'sh',
-                          'si', 'sj', 'sk', 'sl', 'sm', 'sn', 'so', 'sr', 'ss', 'st',
-                          'su', 'sv', 'sy', 'sz', 'tc', 'td', 'tf', 'tg', 'th', 'tj',
-                          'tk', 'tl', 'tm', 'tn', 'to', 'tp', 'tr', 'tt', 'tv', 'tw',
-                          'tz', 'ua', 'ug', 'uk', 'us', 'uy', 'uz', 'va', 'vc', 've',
-                          'vg', 'vi', 'vn', 'vu', 'wf', 'ws', 'ye', 'yt', 'za', 'zm',
-                          'zw')
-URL_START2 = (r'\b(?:[A-Za-z\d-])+' + # Sequences of characters/digits.
-             r'(?:\.[A-Za-z\d]+){0,3}\.' +  # 0-3 additional such groups.
+COMMON_CC_TLDS = regex_or_pairs('ac', 'ad', 'ae', 'af', 'ag', 'ai', 'al', 'am', 'an', 'ao',
+                                'aq', 'ar', 'as', 'at', 'au', 'aw', 'ax', 'az', 'ba', 'bb',
+                                'bd', 'be', 'bf', 'bg', 'bh', 'bi', 'bj', 'bm', 'bn', 'bo',
+                                'br', 'bs', 'bt', 'bv', 'bw', 'by', 'bz', 'ca', 'cc', 'cd',
+                                'cf', 'cg', 'ch', 'ci', 'ck', 'cl', 'cm', 'cn', 'co', 'cr',
+                                'cs', 'cu', 'cv', 'cx', 'cy', 'cz', 'dd', 'de', 'dj', 'dk',
+                                'dm', 'do', 'dz', 'ec', 'ee', 'eg', 'eh', 'er', 'es', 'et',
+                                'eu', 'fi', 'fj', 'fk', 'fm', 'fo', 'fr', 'ga', 'gb', 'gd',
+                                'ge', 'gf', 'gg', 'gh', 'gi', 'gl', 'gm', 'gn', 'gp', 'gq',
+                                'gr', 'gs', 'gt', 'gu', 'gw', 'gy', 'hk', 'hm', 'hn', 'hr',
+                                'ht', 'hu', 'id', 'ie', 'il', 'im', 'in', 'io', 'iq', 'ir',
+                                'is', 'it', 'je', 'jm', 'jo', 'jp', 'ke', 'kg', 'kh', 'ki',
+                                'km', 'kn', 'kp', 'kr', 'kw', 'ky', 'kz', 'la', 'lb', 'lc',
+                                'li', 'lk', 'lr', 'ls', 'lt', 'lu', 'lv', 'ly', 'ma', 'mc',
+                                'md', 'me', 'mg', 'mh', 'mk', 'ml', 'mm', 'mn', 'mo', 'mp',
+                                'mq', 'mr', 'ms', 'mt', 'mu', 'mv', 'mw', 'mx', 'my', 'mz',
+                                'na', 'nc', 'ne', 'nf', 'ng', 'ni', 'nl', 'no', 'np', 'nr',
+                                'nu', 'nz', 'om', 'pa', 'pe', 'pf', 'pg', 'ph', 'pk', 'pl',
+                                'pm', 'pn', 'pr', 'ps', 'pt', 'pw', 'py', 'qa', 're', 'ro',
+                                'rs', 'ru', 'rw', 'sa', 'sb', 'sc', 'sd', 'se', 'sg', 'sh',
+                                'si', 'sj', 'sk', 'sl', 'sm', 'sn', 'so', 'sr', 'ss', 'st',
+                                'su', 'sv', 'sy', 'sz', 'tc', 'td', 'tf', 'tg', 'th', 'tj',
+                                'tk', 'tl', 'tm', 'tn', 'to', 'tp', 'tr', 'tt', 'tv', 'tw',
+                                'tz', 'ua', 'ug', 'uk', 'us', 'uy', 'uz', 'va', 'vc', 've',
+                                'vg', 'vi', 'vn', 'vu', 'wf', 'ws', 'ye', 'yt', 'za', 'zm',
+                                'zw')
+# The character runs below are possessive: each must be followed by a ".",
+# which they cannot contain, so giving characters back could never help.
+# Without this, every ordinary word is re-scanned once per character on
+# failure.
+URL_START2 = (r'\b[A-Za-z\d-]++' + # Sequences of characters/digits.
+             r'(?:\.[A-Za-z\d]++){0,3}\.' +  # 0-3 additional such groups.
              regex_or(COMMON_TLDS, COMMON_CC_TLDS) + # Top-level domains.
              r'(?:\.' + COMMON_CC_TLDS + ')?' +          # Optional second top-level domains.
              pos_lookahead(r'\W|$'))
@@ -157,17 +186,54 @@ DECORATIONS = regex_or('[♫♪]+', u'[★☆]+', '[♥❤♡]+', r'[\u2639-\u26
                        r'[\ue001-\uebbb]+')
 
 # Abbreviations.
+def regexify_abbrev_char(c):
+    if c == '.':
+        return r'\.'
+    return r"[%s%s]" % (c, c.upper())
+
+
 def regexify_abbrev(abbrev):
-    icase = []
-    for c in abbrev:
-        if c == '.':
-            icase.append(r'\.')
-        else:
-            icase.append(r"[%s%s]" % (c, c.upper()))
+    icase = [regexify_abbrev_char(c) for c in abbrev]
     pattern = r'\b%s' % ''.join(icase)
     return pattern
 
 
+def abbrev_trie(abbrevs):
+    """Return pattern matching any of ``abbrevs`` with common prefixes merged.
+
+    Equivalent to ``regex_or(*[regexify_abbrev(a) for a in abbrevs])``, but
+    rather than trying each abbreviation in turn the engine follows a single
+    path through a character trie. Branches are ordered by the earliest
+    abbreviation they lead to so that the flat alternation's priority (e.g.,
+    "u.s." before "u.s.a.") is kept. The trie is wrapped in an atomic group
+    as there is never a need to backtrack into it.
+    """
+    # Build trie. The empty string marks the end of an abbreviation and maps to
+    # its position in abbrevs.
+    trie = {}
+    for ii, abbrev in enumerate(abbrevs):
+        node = trie
+        for c in abbrev.lower():
+            node = node.setdefault(c, {})
+        node.setdefault('', ii)
+
+    def node_pattern(node):
+        alts = []
+        for c, child in node.items():
+            if c == '':
+                alts.append((child, ''))
+            else:
+                order, pattern = node_pattern(child)
+                alts.append((order, regexify_abbrev_char(c) + pattern))
+        alts.sort()
+        order = alts[0][0]
+        if len(alts) == 1:
+            return order, alts[0][1]
+        return order, regex_or(*[pattern for _, pattern in alts])
+
+    return r'\b(?>%s)' % node_pattern(trie)[1]
+
+
 TITLES = ['mr.', 'messrs.',
           'mrs.', 'mmes.',
           'ms.',
@@ -182,7 +248,7 @@ OTHER_ABBREVS = ['a.m.', 'p.m.', 'u.s.', 'u.s.a.',
                  'a.d.', 'c.e.', 'b.c.', 'b.c.e.',
                  'd.c.']
 ABBREVS1 = TITLES + STREETS + OTHER_ABBREVS
-ABBREVS = regex_or(*[regexify_abbrev(abbrev) for abbrev in ABBREVS1])
+ABBREVS = abbrev_trie(ABBREVS1)
 
 BOUNDARY_NOT_DOT = regex_or('$', r'\s', r'[“"?!,:;]', ENTITY)
 AA1 = r'(?:[A-Za-z]\.){2,}' + pos_lookahead(BOUNDARY_NOT_DOT)
@@ -199,6 +265,12 @@ NUM_WITH_COMMAS = (r'(?:(?<!\d)\d{1,3},)+?\d{3}' +
 CURRENCY = regex_or(u'[$£¥ƒ]', r'[\u20A0-\u20CF]')
 NUM_COMB = CURRENCY + r"?\d+(?:\.\d+)+%?"
 
+# All of the above start with a digit or currency symbol. Checking for one up
+# front lets the engine skip the lot with a single test at most positions.
+NUM_START = r'[\d$£¥ƒ\u20A0-\u20CF]'
+NUMBERS = (pos_lookahead(NUM_START) +
+           regex_or(TIMELIKE, NUM_NUM, NUM_WITH_COMMAS, NUM_COMB))
+
 # Miscellaneous other.
 SEPARATORS = regex_or('--+', '―', '—', '~', '–', '=')
 THINGS_THAT_SPLIT_WORDS = '[^\\s\\.,?\"]'
@@ -206,13 +278,17 @@ EMBEDDED_APOSTROPHE = (THINGS_THAT_SPLIT_WORDS + "+['’′]" +
                        THINGS_THAT_SPLIT_WORDS  +  '*')
 
 # Combine into one BIG pattern.
+#
+# NOTE: Order matters. The alternation is resolved by the backtracking
+# engine in priority order (first alternative that matches wins), NOT
+# leftmost-longest, and several members rely on lookarounds (URL, EMAIL,
+# ARBITRARY_ABBREV, NUM_WITH_COMMAS). Consequently, it cannot be handed off
+# to a DFA-based multi-pattern matcher (Hyperscan, RE2) without changing the
+# tokenization.
 PROTECT = [HEARTS,
            URL,
            EMAIL,
-           TIMELIKE,
-           NUM_NUM,
-           NUM_WITH_COMMAS,
-           NUM_COMB,
+           NUMBERS,
            EMOTICON,
            ARROWS,
            ENTITY,
@@ -231,7 +307,16 @@ PROTECT_PATTERN = regex_or(*PROTECT)
 #########################################
 # Additional patterns
 #########################################
-WHITESPACE = r'\s+'
+# Spelled out rather than \s so that it can be compiled by the standard library
+# re module, which is faster than regex for a pattern this simple but whose \s
+# also matches \x1c-\x1f.
+WHITESPACE = ('[\t\n\x0b\x0c\r \x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f'
+              '\u205f\u3000]+')
+
+# Other than the space, every character matched by WHITESPACE is unprintable,
+# so texts that are printable and free of double spaces need no squeezing.
+# Python 2 strings lack isprintable(), in which case texts are always squeezed.
+_isprintable = getattr(type(''), 'isprintable', lambda text: False)
 
 EDGE_PUNCT = r"""['"\p{Pi}\p{Pf}\p{Ps}\p{Pe}\p{So}]"""
 NOT_EDGE_PUNCT = r"""[a-zA-Z0-9]""" # Content characters.
@@ -240,6 +325,15 @@ OFF_EDGE = r"(^|$|:|;|\s|\.|,)" # Colon/semicolon also belong to EDGE_PUNCT
 EDGE_PUNCT_LEFT = '%s(%s+)(%s)' % (OFF_EDGE, EDGE_PUNCT, NOT_EDGE_PUNCT)
 EDGE_PUNCT_RIGHT = '(%s)(%s+)%s' % (NOT_EDGE_PUNCT, EDGE_PUNCT, OFF_EDGE)
 
+# Both of the above in a single pattern, for splitting off edge punctuation in
+# one pass. The surrounding context is matched by lookarounds rather than
+# consumed so that adjacent left and right edges are still found.
+EDGE_PUNCT_BOTH = regex_or(
+    pos_lookbehind(OFF_EDGE) + '(?P<left>%s+)' % EDGE_PUNCT +
+    pos_lookahead(NOT_EDGE_PUNCT),
+    pos_lookbehind(NOT_EDGE_PUNCT) + '(?P<right>%s+)' % EDGE_PUNCT +
+    pos_lookahead(OFF_EDGE))
+
 MORE_PUNCT = '[\-+―—~–=|_^]+'
 ALLPUNCT_SEQ = '^%s$' % regex_or(PUNCT_SEQ, EDGE_PUNCT, MORE_PUNCT)
 
@@ -247,6 +341,40 @@ ALLPUNCT_SEQ = '^%s$' % regex_or(PUNCT_SEQ, EDGE_PUNCT, MORE_PUNCT)
 #########################################
 # Actual tokenizer.
 #########################################
+def _iter_batches(texts, batch_size):
+    """Yield successive lists of up to ``batch_size`` texts."""
+    texts = iter(texts)
+    while True:
+        batch = list(islice(texts, batch_size))
+        if not batch:
+            break
+        yield batch
+
+
+# Tokenizer used by the current worker process; set by _init_worker.
+_worker_tokenizer = None
+
+
+def _init_worker(kwargs):
+    """Initialize a worker process with a ``Tokenizer`` constructed from the
+    keyword arguments ``kwargs``.
+
+    The tokenizer is kept for the life of the worker so that, if caching is
+    enabled, its cache is shared by all of the batches the worker handles.
+    """
+    global _worker_tokenizer
+    _worker_tokenizer = Tokenizer(**kwargs)
+
+
+def _tokenize_batch(texts):
+    """Tokenize a batch of texts in a worker process.
+
+    Defined at module level so that it may be pickled by ``multiprocessing``.
+    """
+    tokenize = _worker_tokenizer.tokenize
+    return [tokenize(text) for text in texts]
+
+
 class Tokenizer(object):
     """Twitter and web aware English tokenizer.
 
@@ -268,23 +396,64 @@ class Tokenizer(object):
         tokens.
         (Default: False)
 
+    cache_size : int, optional
+        If > 0, the tokenizations of the ``cache_size`` most recently
+        tokenized texts are cached, so that repeated texts (e.g., retweets)
+        are tokenized only once. Requires Python >= 3.2.
+        (Default: 0)
+
     Attributes
     ----------
     whitespace_reo
     allpunct_seq_reo
     left_edge_punct_reo
     right_edge_punct_reo
+    edge_punct_reo
     protected_reo
+    protected_split_reo
     """
-    whitespace_reo = re.compile(WHITESPACE, RE_FLAGS)
+    __slots__ = ('casefold', 'elim_punct', 'cache_size', '_tokenize_cached')
+
+    # Compiled once per process when the class is created. Compiled patterns
+    # pickle as their source string and are recompiled on load, so there is
+    # nothing to be gained by caching them to disk.
+    whitespace_reo = std_re.compile(WHITESPACE, std_re.UNICODE)
     allpunct_seq_reo = re.compile(ALLPUNCT_SEQ, RE_FLAGS)
     left_edge_punct_reo = re.compile(EDGE_PUNCT_LEFT, RE_FLAGS)
     right_edge_punct_reo = re.compile(EDGE_PUNCT_RIGHT, RE_FLAGS)
+    edge_punct_reo = re.compile(EDGE_PUNCT_BOTH, RE_FLAGS)
     protected_reo = re.compile(PROTECT_PATTERN, RE_FLAGS)
 
-    def __init__(self, casefold=False, elim_punct=False):
-        self.__dict__.update(locals())
-        del self.self
+    # Same as protected_reo, but wrapped in a capturing group so that split()
+    # returns protected sequences interleaved with the unprotected text between
+    # them, letting the regex engine rather than Python drive the scan. Each
+    # match contributes one item per group, the first of which is the
+    # protected sequence.
+    protected_split_reo = re.compile('(%s)' % PROTECT_PATTERN, RE_FLAGS)
+    _split_stride = protected_split_reo.groups + 1
+
+    def __init__(self, casefold=False, elim_punct=False, cache_size=0):
+        self.casefold = casefold
+        self.elim_punct = elim_punct
+        self.cache_size = cache_size
+        self._tokenize_cached = None
+        if cache_size > 0:
+            if lru_cache is None:
+                raise ValueError('cache_size requires Python >= 3.2')
+            # Tokenizations are cached as tuples so that callers cannot
+            # mutate the cached copy. The cached function closes over an
+            # uncached twin rather than self to avoid a reference cycle.
+            uncached = Tokenizer(casefold, elim_punct)
+            self._tokenize_cached = lru_cache(maxsize=cache_size)(
+                lambda text: tuple(uncached._tokenize(text)))
+
+    def __getstate__(self):
+        # The cache holds a local function, which cannot be pickled, so only
+        # the settings are saved and an empty cache is rebuilt on unpickling.
+        return (self.casefold, self.elim_punct, self.cache_size)
+
+    def __setstate__(self, state):
+        self.__init__(*state)
 
     def _postprocess(self, tokens):
         """Postprocess tokenization to remove punctuation and, optionally,
@@ -300,18 +469,23 @@ class Tokenizer(object):
         new_tokens : list of str
             Postprocessed version of ``tokens``.
         """
+        elim_punct = self.elim_punct
+        allpunct_seq_match = self.allpunct_seq_reo.match
         new_tokens = []
+        new_tokens_append = new_tokens.append
         for token in tokens:
             # Be extra safe in case our regexes went awry.
             if token == '' or token == []:
                 continue
 
-            # Eliminate punctuation.
-            if self.elim_punct:
-                if not self.allpunct_seq_reo.match(token) is None:
+            # Eliminate punctuation. Nothing matched by ALLPUNCT_SEQ is
+            # alphanumeric, so the regex is only consulted for tokens that
+            # do not begin with a letter or digit.
+            if elim_punct and not token[0].isalnum():
+                if not allpunct_seq_match(token) is None:
                     continue
 
-            new_tokens.append(token)
+            new_tokens_append(token)
 
         return new_tokens
 
@@ -328,41 +502,142 @@ class Tokenizer(object):
         tokens : list of str
             Tokenization.
         """
+        if self._tokenize_cached is not None:
+            return list(self._tokenize_cached(text))
+        return self._tokenize(text)
+
+    def _tokenize(self, text):
+        """Tokenize text, bypassing the cache.
+        """
+        # Bind hot methods locally to avoid repeated attribute lookups.
+        ws_sub = self.whitespace_reo.sub
+        ep_sub = self.edge_punct_reo.sub
+        prot_split = self.protected_split_reo.split
+        stride = self._split_stride
+
         # Optional casefolding.
         if self.casefold:
             text = text.lower()
 
         # Squeeze off whitespace.
-        text = self.whitespace_reo.sub(' ', text)
+        if '  ' in text or not _isprintable(text):
+            text = ws_sub(' ', text)
 
-        # Split off edge punctuation.
-        text = self.left_edge_punct_reo.sub(r'\1\2 \3', text)
-        text = self.right_edge_punct_reo.sub(r'\1 \2\3', text)
+        # Split off edge punctuation. Only one of the groups participates in
+        # any given match, and the other expands to the empty string.
+        text = ep_sub(r'\g<left> \g<right>', text)
 
         # Identify all portions of string to leave as is (protected) and
-        # tokenize JUST the unprotected sequences.
-        protected = []
-        unprotected = []
-        ii = 0
-        for mo in self.protected_reo.finditer(text):
-            unprotected.append( (ii, mo.start()) )
-            protected.append( mo.span() )
-            ii = mo.end()
-        unprotected.append( (ii, len(text)) )
-        protected = [text[bi:ei] for bi, ei  in protected]
-        unprotected = [text[bi:ei] for bi, ei  in unprotected]
-        unprotected = [s.split() for s in unprotected]
-
-        # Combine the tokenizations of protected and unprotected spans.
-        tokens = []
-        ii = 0
-        for ii, protected_token in enumerate(protected):
-            tokens.extend(unprotected[ii])
-            tokens.append(protected_token)
-        tokens.extend(unprotected[-1])
+        # tokenize JUST the unprotected sequences, emitting tokens in order.
+        pieces = prot_split(text)
+        tokens = pieces[0].split()
+        tokens_extend = tokens.extend
+        tokens_append = tokens.append
+        for protected, unprotected in zip(pieces[1::stride],
+                                          pieces[stride::stride]):
+            tokens_append(protected)
+            if unprotected:
+                tokens_extend(unprotected.split())
 
         # Postprocess tokenization to remove empty tokenizations and,
         # optionally, punctuation.
         tokens = self._postprocess(tokens)
 
         return tokens
+
+    def tokenize_many(self, texts, n_jobs=None, chunksize=512):
+        """Tokenize a collection of texts in parallel.
+
+        Parameters
+        ----------
+        texts : iterable of str
+            Texts to be tokenized.
+
+        n_jobs : int, optional
+            Number of worker processes. If None, uses the number of CPUs. If
+            1, texts are tokenized in the current process.
+            (Default: None)
+
+        chunksize : int, optional
+            Number of texts sent to a worker at a time.
+            (Default: 512)
+
+        Returns
+        -------
+        tokenizations : list of list of str
+            Tokenizations, where ``tokenizations[i]`` is the tokenization of
+            the ``i``-th text.
+        """
+        return list(self._iter_tokenize(texts, n_jobs, chunksize))
+
+    def tokenize_file(self, path, encoding='utf-8', n_jobs=None,
+                      chunksize=512):
+        """Tokenize a file containing one text per line.
+
+        Lines are read lazily and tokenizations yielded in order as they
+        become available. At most ``2*n_jobs`` batches of ``chunksize`` lines
+        are in flight at any time, so memory use does not grow with the size
+        of the file, even if the caller consumes tokenizations slowly.
+
+        Parameters
+        ----------
+        path : str
+            Path to file.
+
+        encoding : str, optional
+            Encoding of file.
+            (Default: 'utf-8')
+
+        n_jobs : int, optional
+            Number of worker processes. If None, uses the number of CPUs. If
+            1, lines are tokenized in the current process.
+            (Default: None)
+
+        chunksize : int, optional
+            Number of lines sent to a worker at a time.
+            (Default: 512)
+
+        Yields
+        ------
+        tokens : list of str
+            Tokenization of the next line of the file.
+        """
+        with io.open(path, 'r', encoding=encoding) as f:
+            for tokens in self._iter_tokenize(f, n_jobs, chunksize):
+                yield tokens
+
+    def _iter_tokenize(self, texts, n_jobs, chunksize):
+        """Yield tokenizations of ``texts`` in order, using ``n_jobs`` worker
+        processes each handed ``chunksize`` texts at a time.
+
+        Unlike ``Pool.imap``, which keeps tokenizing regardless of how quickly
+        results are consumed, no more than ``2*n_jobs`` batches are submitted
+        ahead of the caller.
+        """
+        if n_jobs == 1:
+            tokenize = self.tokenize
+            for text in texts:
+                yield tokenize(text)
+            return
+        kwargs = {'casefold' : self.casefold,
+                  'elim_punct' : self.elim_punct,
+                  'cache_size' : self.cache_size,
+                  }
+        if n_jobs is None:
+            n_jobs = multiprocessing.cpu_count()
+        max_pending = 2*n_jobs
+        pending = deque()
+        pool = multiprocessing.Pool(n_jobs, initializer=_init_worker,
+                                    initargs=(kwargs, ))
+        try:
+            for batch in _iter_batches(texts, chunksize):
+                pending.append(pool.apply_async(_tokenize_batch, (batch, )))
+                if len(pending) >= max_pending:
+                    for tokens in pending.popleft().get():
+                        yield tokens
+            while pending:
+                for tokens in pending.popleft().get():
+                    yield tokens
+        finally:
+            pool.terminate()
+            pool.join()
@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import io
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+
+from twokenize_py import english
+from twokenize_py.english import Tokenizer, lru_cache
+
+
+TEXTS = ['Think about it: "Blood Simple" was the best film of 1984;',
+         "Mr. Smith's at http://www.cia.gov/x.html :-) <3",
+         'U.S.A. 12:30 1,000,000 $3.50 foo@bar.com #tag @user',
+         'Think about it: "Blood Simple" was the best film of 1984;',
+         '',
+         ]
+
+
+class TestTokenizerPickle(unittest.TestCase):
+    def test_pickle_all_protocols(self):
+        tok = Tokenizer(casefold=True, elim_punct=True)
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            new_tok = pickle.loads(pickle.dumps(tok, protocol))
+            self.assertEqual(new_tok.casefold, True)
+            self.assertEqual(new_tok.elim_punct, True)
+            self.assertEqual(new_tok.cache_size, 0)
+            for text in TEXTS:
+                self.assertEqual(new_tok.tokenize(text), tok.tokenize(text))
+
+
+@unittest.skipIf(lru_cache is None, 'requires functools.lru_cache')
+class TestTokenizerCache(unittest.TestCase):
+    def test_cached_matches_uncached(self):
+        for kwargs in [{}, {'casefold' : True, 'elim_punct' : True}]:
+            uncached = Tokenizer(**kwargs)
+            cached = Tokenizer(cache_size=2, **kwargs)
+            for text in TEXTS + TEXTS:
+                self.assertEqual(cached.tokenize(text),
+                                 uncached.tokenize(text))
+
+    def test_mutating_result_does_not_change_cache(self):
+        tok = Tokenizer(cache_size=2)
+        text = TEXTS[0]
+        expected = tok.tokenize(text)
+        tokens = tok.tokenize(text)
+        tokens.append('extra')
+        del tokens[0]
+        self.assertEqual(tok.tokenize(text), expected)
+        self.assertEqual(tok._tokenize_cached(text), tuple(expected))
+
+    def test_pickle_rebuilds_empty_cache(self):
+        tok = Tokenizer(casefold=True, cache_size=5)
+        tok.tokenize(TEXTS[0])
+        new_tok = pickle.loads(pickle.dumps(tok, pickle.HIGHEST_PROTOCOL))
+        self.assertEqual(new_tok.cache_size, 5)
+        self.assertEqual(new_tok._tokenize_cached.cache_info().currsize, 0)
+        self.assertEqual(new_tok.tokenize(TEXTS[0]), tok.tokenize(TEXTS[0]))
+
+
+class TestTokenizeMany(unittest.TestCase):
+    def test_matches_tokenize(self):
+        texts = TEXTS*7
+        for kwargs in [{'casefold' : True},
+                       {'elim_punct' : True},
+                       {'casefold' : True, 'elim_punct' : True}]:
+            tok = Tokenizer(**kwargs)
+            expected = [tok.tokenize(text) for text in texts]
+            self.assertEqual(tok.tokenize_many(texts, n_jobs=2, chunksize=3),
+                             expected)
+            self.assertEqual(
+                tok.tokenize_many(iter(texts), n_jobs=1, chunksize=3),
+                expected)
+
+    def test_settings_reach_workers(self):
+        text = TEXTS[0]
+        default = Tokenizer().tokenize_many([text], n_jobs=2)[0]
+        for kwargs in [{'casefold' : True}, {'elim_punct' : True}]:
+            tokens = Tokenizer(**kwargs).tokenize_many([text], n_jobs=2)[0]
+            self.assertNotEqual(tokens, default)
+
+    def test_empty(self):
+        self.assertEqual(Tokenizer().tokenize_many([], n_jobs=2), [])
+
+
+# Directory in which workers record cache statistics; passed through the
+# environment so that it also reaches workers that are spawned, not forked.
+STATS_DIR_VAR = 'TWOKENIZE_PY_TEST_STATS_DIR'
+_tokenize_batch = english._tokenize_batch
+
+
+def _tokenize_batch_recording_stats(texts):
+    """Wrapper around ``_tokenize_batch`` that records the cache statistics of
+    the worker's tokenizer after each batch.
+    """
+    tokenizations = _tokenize_batch(texts)
+    info = english._worker_tokenizer._tokenize_cached.cache_info()
+    fn = os.path.join(os.environ[STATS_DIR_VAR], str(os.getpid()))
+    with open(fn, 'w') as f:
+        f.write('%d %d' % (info.hits, info.misses))
+    return tokenizations
+
+
+@unittest.skipIf(lru_cache is None, 'requires functools.lru_cache')
+class TestTokenizeParallelCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'texts.txt')
+        self.stats_dir = os.path.join(self.tmpdir, 'stats')
+        os.mkdir(self.stats_dir)
+        os.environ[STATS_DIR_VAR] = self.stats_dir
+        english._tokenize_batch = _tokenize_batch_recording_stats
+        self.texts = ['duplicate :) #1', 'RT @user duplicate'] * 10
+        with io.open(self.path, 'w', encoding='utf-8') as f:
+            for text in self.texts:
+                f.write(text + '\n')
+
+    def tearDown(self):
+        english._tokenize_batch = _tokenize_batch
+        del os.environ[STATS_DIR_VAR]
+        shutil.rmtree(self.tmpdir)
+
+    def check_worker_caches(self):
+        n_distinct = len(set(self.texts))
+        total = 0
+        for fn in os.listdir(self.stats_dir):
+            with open(os.path.join(self.stats_dir, fn)) as f:
+                hits, misses = map(int, f.read().split())
+            # Each worker tokenizes a given text at most once, no matter how
+            # many batches it occurs in.
+            self.assertLessEqual(misses, n_distinct)
+            total += hits + misses
+            os.remove(os.path.join(self.stats_dir, fn))
+        self.assertEqual(total, len(self.texts))
+
+    def test_tokenize_many(self):
+        tok = Tokenizer(cache_size=8)
+        tokenizations = tok.tokenize_many(self.texts, n_jobs=2, chunksize=1)
+        self.assertEqual(tokenizations, [tok.tokenize(text)
+                                         for text in self.texts])
+        self.check_worker_caches()
+
+    def test_tokenize_file(self):
+        tok = Tokenizer(cache_size=8)
+        tokenizations = list(tok.tokenize_file(
+            self.path, n_jobs=2, chunksize=1))
+        self.assertEqual(tokenizations, [tok.tokenize(text)
+                                         for text in self.texts])
+        self.check_worker_caches()
+
+
+class TestTokenizeFile(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'texts.txt')
+        self.lines = ['line %d: "quoted" :-) #%d' % (ii, ii) if ii % 7 else ''
+                      for ii in range(200)]
+        with io.open(self.path, 'w', encoding='utf-8') as f:
+            for line in self.lines:
+                f.write(line + '\n')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_line_order_and_empty_lines(self):
+        tok = Tokenizer()
+        expected = [tok.tokenize(line) for line in self.lines]
+        self.assertIn([], expected)
+        for n_jobs in [1, 2]:
+            tokenizations = list(tok.tokenize_file(
+                self.path, n_jobs=n_jobs, chunksize=16))
+            self.assertEqual(tokenizations, expected)
+
+    def test_bounded_read_ahead(self):
+        n_read = [0]
+        def texts():
+            for line in self.lines:
+                n_read[0] += 1
+                yield line
+        tok = Tokenizer()
+        n_jobs = 2
+        chunksize = 4
+        tokenizations = tok._iter_tokenize(texts(), n_jobs, chunksize)
+        try:
+            self.assertEqual(next(tokenizations), tok.tokenize(self.lines[0]))
+            self.assertLessEqual(n_read[0], 2*n_jobs*chunksize)
+        finally:
+            tokenizations.close()
+
+
+if __name__ == '__main__':
+    unittest.main()